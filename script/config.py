@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
+import atexit
+import functools
 import os
 import sys
 import shutil
+import stat
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 
 try:
     import termios
@@ -11,21 +16,46 @@ except ImportError:
     termios = None
     tty = None
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+FICLONE = 0x40049409
+
+_which = functools.lru_cache(maxsize=None)(shutil.which)
+
+if sys.stdout.isatty():
+    HEADER = "\033[95m\033[1m{}\033[0m"
+    DONE = "\033[92m\033[1m{}\033[0m"
+    INFO = "\033[94m{}\033[0m"
+    OK = "\033[92m{}\033[0m"
+    WARN = "\033[93m{}\033[0m"
+    ERR = "\033[91m{}\033[0m"
+else:
+    HEADER = DONE = INFO = OK = WARN = ERR = "{}"
+
 
 class ExoInstaller:
-    class Colors:
-        HEADER = "\033[95m"
-        GREEN = "\033[92m"
-        YELLOW = "\033[93m"
-        RED = "\033[91m"
-        BLUE = "\033[94m"
-        ENDC = "\033[0m"
-        BOLD = "\033[1m"
+    HEADER_LINE = HEADER.format("=" * 60)
+    FILE_ACTIONS = ("b", "o", "s")
+    TREE_ACTIONS = ("b", "o", "q")
 
     def __init__(self):
         self.config_dir = os.path.expanduser("~/.config/")
         self.source_dir = os.path.expanduser("~/.cache/Exo/")
+        self.exodefaults_dir = os.path.join(self.source_dir, "exodefaults")
+        self.wallpaper_src = os.path.join(self.exodefaults_dir, "default_wallpaper.png")
+        self.wallpaper_dir = os.path.expanduser("~/Pictures/Wallpapers")
+        self.wallpaper_dest = os.path.join(self.wallpaper_dir, "default.png")
+        self.ignis_dir = os.path.join(self.config_dir, "ignis")
+        self.user_settings = os.path.join(self.ignis_dir, "user_settings.json")
+        self.preview_src = os.path.join(self.exodefaults_dir, "preview-colors.scss")
+        self.preview_dest = os.path.join(self.ignis_dir, "styles", "preview-colors.scss")
+        self.marker = os.path.join(self.config_dir, ".exo-installed")
         self.dry_run = False
+        self._tty_fd = None
+        self._tty_old = None
 
     # ======================
     # Core
@@ -33,50 +63,155 @@ class ExoInstaller:
 
     def run(self):
         self.print_header("EXO INSTALLER")
-        print(f"{self.Colors.BLUE}This installer will set up Exo configs in your home directory.{self.Colors.ENDC}")
-        print(f"{self.Colors.BLUE}Target config directory: {self.config_dir}{self.Colors.ENDC}")
+        print(INFO.format("This installer will set up Exo configs in your home directory."))
+        print(INFO.format(f"Target config directory: {self.config_dir}"))
+
+        if self._is_up_to_date():
+            print(OK.format("Already up to date."), f"Remove {self.marker} to reinstall.")
+            return
+
         self.full_install()
 
     def run_command(self, cmd, **kwargs):
         if self.dry_run:
             print(
-                f"{self.Colors.YELLOW}[DRY RUN]{self.Colors.ENDC} Would execute: {' '.join(cmd)}"
+                WARN.format("[DRY RUN]"), f"Would execute: {' '.join(cmd)}"
             )
             return subprocess.CompletedProcess(cmd, 0)
 
         try:
             return subprocess.run(cmd, check=True, **kwargs)
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            print(f"{self.Colors.RED}[ERROR]{self.Colors.ENDC} Command failed: {e}")
+            print(ERR.format("[ERROR]"), f"Command failed: {e}")
+            return None
+
+    def _spawn(self, cmd):
+        path = _which(cmd[0])
+        if self.dry_run or path is None or not hasattr(os, "posix_spawn"):
+            return self.run_command(cmd, capture_output=True)
+
+        # output goes to a pipe, not our stdout, so it can't interleave
+        # with lines printed by other final_setup workers
+        r, w = os.pipe()
+        try:
+            pid = os.posix_spawn(
+                path,
+                cmd,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, w, 1),
+                    (os.POSIX_SPAWN_DUP2, w, 2),
+                ],
+            )
+        except OSError as e:
+            os.close(r)
+            self._println(ERR.format("[ERROR]"), f"Command failed: {e}")
             return None
+        finally:
+            os.close(w)
+
+        with os.fdopen(r, "rb") as f:
+            output = f.read()
+        _, status = os.waitpid(pid, 0)
+        return subprocess.CompletedProcess(
+            cmd, os.waitstatus_to_exitcode(status), stdout=output
+        )
+
+    def _ensure_dirs(self, *paths):
+        for path in paths:
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                os.makedirs(path, exist_ok=True)
+
+    def _fast_copy(self, src, dst):
+        if not hasattr(os, "sendfile"):
+            shutil.copy(src, dst)
+            return
+
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            st = os.fstat(src_fd)
+            # no O_TRUNC: dst may be a link to src, check before truncating
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o644)
+            try:
+                dst_st = os.fstat(dst_fd)
+                if (dst_st.st_dev, dst_st.st_ino) == (st.st_dev, st.st_ino):
+                    return
+                os.ftruncate(dst_fd, 0)
+                if not self._reflink(src_fd, dst_fd):
+                    if not self._sendfile(src_fd, dst_fd, st.st_size):
+                        shutil.copy(src, dst)
+                        return
+                os.fchmod(dst_fd, stat.S_IMODE(st.st_mode))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def _reflink(self, src_fd, dst_fd):
+        if fcntl is None:
+            return False
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        except OSError:
+            return False
+        return True
+
+    def _sendfile(self, src_fd, dst_fd, size):
+        offset = 0
+        while True:
+            try:
+                sent = os.sendfile(dst_fd, src_fd, offset, max(size, 1 << 20))
+            except OSError:
+                if offset:
+                    raise
+                return False
+            if sent == 0:
+                return True
+            offset += sent
 
     # ======================
     # UI
     # ======================
 
     def print_header(self, title):
-        line = "=" * 60
-        print(f"\n{self.Colors.HEADER}{self.Colors.BOLD}{line}{self.Colors.ENDC}")
-        print(f"{self.Colors.HEADER}{self.Colors.BOLD} {title.center(58)} {self.Colors.ENDC}")
-        print(f"{self.Colors.HEADER}{self.Colors.BOLD}{line}{self.Colors.ENDC}\n")
+        line = self.HEADER_LINE
+        sys.stdout.write(
+            f"\n{line}\n{HEADER.format(f' {title.center(58)} ')}\n{line}\n\n"
+        )
+        sys.stdout.flush()
+
+    def _println(self, *parts):
+        # one write per line so output from worker threads doesn't interleave
+        sys.stdout.write(" ".join(parts) + "\n")
 
     def get_user_choice(self, prompt, options):
+        opts = frozenset(o.lower() for o in options)
+        choices = ", ".join(options)
+
         if termios and tty:
             try:
                 print(
-                    f"{self.Colors.YELLOW}{prompt}{self.Colors.ENDC}",
+                    WARN.format(prompt),
                     end="",
                     flush=True,
                 )
-                fd = sys.stdin.fileno()
-                old = termios.tcgetattr(fd)
+                fd, old = self._tty_state()
                 try:
                     tty.setraw(fd)
                     while True:
-                        c = sys.stdin.read(1).lower()
-                        if c in options:
-                            print(c)
-                            return c
+                        data = os.read(fd, 8)
+                        if not data:
+                            raise EOFError
+                        if b"\x03" in data:
+                            raise KeyboardInterrupt
+                        for c in data.decode(errors="ignore").lower():
+                            if c in opts:
+                                print(c)
+                                return c
                 finally:
                     termios.tcsetattr(fd, termios.TCSADRAIN, old)
             except termios.error:
@@ -84,11 +219,19 @@ class ExoInstaller:
 
         while True:
             c = input(
-                f"{self.Colors.YELLOW}{prompt}{self.Colors.ENDC}"
+                WARN.format(prompt)
             ).lower()
-            if c in options:
+            if c in opts:
                 return c
-            print(f"{self.Colors.RED}Invalid input. Please choose one of: {', '.join(options)}{self.Colors.ENDC}")
+            print(ERR.format(f"Invalid input. Please choose one of: {choices}"))
+
+    def _tty_state(self):
+        if self._tty_old is None:
+            fd = sys.stdin.fileno()
+            self._tty_old = termios.tcgetattr(fd)
+            self._tty_fd = fd
+            atexit.register(termios.tcsetattr, fd, termios.TCSADRAIN, self._tty_old)
+        return self._tty_fd, self._tty_old
 
     # ======================
     # Desktop Configs
@@ -97,14 +240,14 @@ class ExoInstaller:
     def install_desktop_configs(self, desktop_env):
         self.print_header("DESKTOP CONFIGURATION")
 
-        if desktop_env in ["niri", "both"]:
+        if desktop_env in ("niri", "both"):
             self._copy_config(
                 "niri",
                 "config.kdl",
                 "exodefaults/config.kdl",
             )
 
-        if desktop_env in ["hyprland", "both"]:
+        if desktop_env in ("hyprland", "both"):
             self._copy_config(
                 "hypr",
                 "hyprland.conf",
@@ -112,29 +255,29 @@ class ExoInstaller:
             )
 
     def _copy_config(self, folder, filename, source_rel):
-        print(f"{self.Colors.BLUE}→ Installing config for:{self.Colors.ENDC} {folder}")
+        print(INFO.format("→ Installing config for:"), folder)
         dest_dir = os.path.join(self.config_dir, folder)
-        os.makedirs(dest_dir, exist_ok=True)
+        self._ensure_dirs(dest_dir)
 
         src = os.path.join(self.source_dir, source_rel)
         dest = os.path.join(dest_dir, filename)
 
         if os.path.exists(dest):
-            print(f"{self.Colors.YELLOW}[WARNING]{self.Colors.ENDC} {dest} already exists.")
+            print(WARN.format("[WARNING]"), f"{dest} already exists.")
             choice = self.get_user_choice(
                 "Choose action: Backup (b), Overwrite (o), Skip (s): ",
-                ["b", "o", "s"],
+                self.FILE_ACTIONS,
             )
 
             if choice == "b":
-                shutil.copy2(dest, dest + ".bak")
-                print(f"{self.Colors.GREEN}Backup created:{self.Colors.ENDC} {dest}.bak")
+                self._fast_copy(dest, dest + ".bak")
+                print(OK.format("Backup created:"), f"{dest}.bak")
             elif choice == "s":
-                print(f"{self.Colors.YELLOW}Skipped:{self.Colors.ENDC} {dest}")
+                print(WARN.format("Skipped:"), dest)
                 return
 
-        shutil.copy2(src, dest)
-        print(f"{self.Colors.GREEN}Installed:{self.Colors.ENDC} {dest}")
+        self._fast_copy(src, dest)
+        print(OK.format("Installed:"), dest)
 
     # ======================
     # Final Setup
@@ -143,53 +286,63 @@ class ExoInstaller:
     def final_setup(self):
         self.print_header("FINAL SETUP")
 
-        wallpaper_src = os.path.join(
-            self.source_dir, "exodefaults", "default_wallpaper.png"
+        self._ensure_dirs(
+            self.wallpaper_dir,
+            self.ignis_dir,
+            os.path.dirname(self.preview_dest),
         )
-        wallpaper_dir = os.path.expanduser("~/Pictures/Wallpapers")
-        os.makedirs(wallpaper_dir, exist_ok=True)
 
-        wallpaper_dest = os.path.join(wallpaper_dir, "default.png")
-        if not os.path.exists(wallpaper_dest):
-            shutil.copyfile(wallpaper_src, wallpaper_dest)
-            print(f"{self.Colors.GREEN}Wallpaper installed:{self.Colors.ENDC} {wallpaper_dest}")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self._setup_wallpaper_colors),
+                executor.submit(self._setup_user_settings),
+                executor.submit(self._setup_preview_colors),
+            ]
+            results = [future.result() for future in futures]
+        return all(results)
+
+    def _setup_wallpaper_colors(self):
+        if not os.path.exists(self.wallpaper_dest):
+            self._fast_copy(self.wallpaper_src, self.wallpaper_dest)
+            self._println(OK.format("Wallpaper installed:"), self.wallpaper_dest)
         else:
-            print(f"{self.Colors.YELLOW}Wallpaper already exists:{self.Colors.ENDC} {wallpaper_dest}")
-
-        ignis_dir = os.path.join(self.config_dir, "ignis")
-        user_settings = os.path.join(ignis_dir, "user_settings.json")
+            self._println(WARN.format("Wallpaper already exists:"), self.wallpaper_dest)
 
-        print(f"\n{self.Colors.BLUE}Generating initial color scheme (Matugen)...{self.Colors.ENDC}")
-        if shutil.which("matugen"):
-            cmd = ["matugen", "image", wallpaper_dest]
-            result = self.run_command(cmd)
+        self._println(INFO.format("Generating initial color scheme (Matugen)..."))
+        if _which("matugen"):
+            cmd = ["matugen", "image", self.wallpaper_dest]
+            result = self._spawn(cmd)
 
             if result is None or (
                 hasattr(result, "returncode") and result.returncode != 0
             ):
-                print(f"{self.Colors.RED}[FAILED]{self.Colors.ENDC} Matugen color generation failed.")
-            else:
-                print(f"{self.Colors.GREEN}[SUCCESS]{self.Colors.ENDC} Color scheme generated.")
-        else:
-            print(f"{self.Colors.RED}[SKIPPED]{self.Colors.ENDC} Matugen not found in PATH.")
-
-        if not os.path.exists(user_settings):
-            os.makedirs(ignis_dir, exist_ok=True)
-            with open(user_settings, "w") as f:
-                f.write("{}")
-            print(f"{self.Colors.GREEN}Created default Ignis user settings.{self.Colors.ENDC}")
-
-        preview_src = os.path.join(
-            self.source_dir, "exodefaults", "preview-colors.scss"
-        )
-        preview_dest = os.path.join(
-            ignis_dir, "styles", "preview-colors.scss"
-        )
-
-        if not os.path.exists(preview_dest):
-            os.makedirs(os.path.dirname(preview_dest), exist_ok=True)
-            shutil.copyfile(preview_src, preview_dest)
-            print(f"{self.Colors.GREEN}Preview color stylesheet installed.{self.Colors.ENDC}")
+                self._println(ERR.format("[FAILED]"), "Matugen color generation failed.")
+                if result is not None and result.stdout:
+                    self._println(result.stdout.decode(errors="replace").rstrip())
+                return False
+            self._println(OK.format("[SUCCESS]"), "Color scheme generated.")
+            return True
+
+        self._println(ERR.format("[SKIPPED]"), "Matugen not found in PATH.")
+        return False
+
+    def _setup_user_settings(self):
+        if not os.path.exists(self.user_settings):
+            tmp = self.user_settings + ".tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, b"{}")
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.user_settings)
+            self._println(OK.format("Created default Ignis user settings."))
+        return True
+
+    def _setup_preview_colors(self):
+        if not os.path.exists(self.preview_dest):
+            self._fast_copy(self.preview_src, self.preview_dest)
+            self._println(OK.format("Preview color stylesheet installed."))
+        return True
 
     # ======================
     # Full Install
@@ -198,35 +351,165 @@ class ExoInstaller:
     def full_install(self):
         self.print_header("FULL INSTALLATION")
 
+        cleanup = []
         for folder in ["ignis", "matugen"]:
             src = os.path.join(self.source_dir, folder)
             dest = os.path.join(self.config_dir, folder)
 
-            print(f"{self.Colors.BLUE}Processing:{self.Colors.ENDC} {folder}")
+            print(INFO.format("Processing:"), folder)
 
             if os.path.exists(dest):
-                print(f"{self.Colors.YELLOW}[EXISTS]{self.Colors.ENDC} {dest}")
+                print(WARN.format("[EXISTS]"), dest)
                 choice = self.get_user_choice(
                     "Action: Backup (b), Overwrite (o), Quit (q): ",
-                    ["b", "o", "q"],
+                    self.TREE_ACTIONS,
                 )
 
                 if choice == "b":
                     shutil.move(dest, dest + "-backup")
-                    print(f"{self.Colors.GREEN}Backup created:{self.Colors.ENDC} {dest}-backup")
+                    print(OK.format("Backup created:"), f"{dest}-backup")
                 elif choice == "o":
-                    shutil.rmtree(dest)
-                    print(f"{self.Colors.YELLOW}Existing directory removed.{self.Colors.ENDC}")
+                    cleanup.append(self._remove_in_background(dest))
+                    print(WARN.format("Removing existing directory in background."))
                 else:
-                    print(f"{self.Colors.RED}Installation aborted by user.{self.Colors.ENDC}")
+                    print(ERR.format("Installation aborted by user."))
                     sys.exit(0)
 
-            shutil.copytree(src, dest)
-            print(f"{self.Colors.GREEN}Installed:{self.Colors.ENDC} {dest}\n")
+            self._parallel_copytree(src, dest)
+            print(OK.format("Installed:"), dest, end="\n\n")
 
         self.install_desktop_configs("both")
-        self.final_setup()
-        print(f"\n{self.Colors.GREEN}{self.Colors.BOLD}✔ Installation complete. Enjoy Exo!{self.Colors.ENDC}")
+        complete = self.final_setup()
+
+        for thread, errors in cleanup:
+            thread.join()
+            for e in errors:
+                print(WARN.format("[WARNING]"), f"Could not remove old directory: {e}")
+        if complete:
+            self._write_marker()
+        print("\n" + DONE.format("✔ Installation complete. Enjoy Exo!"))
+
+    def _parallel_copytree(self, src, dest):
+        os.makedirs(dest, exist_ok=True)
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for entry, rel in self._walk_rel(src):
+                target = os.path.join(dest, rel)
+                if entry.is_dir():
+                    try:
+                        os.mkdir(target)
+                    except FileExistsError:
+                        pass
+                else:
+                    futures.append(
+                        executor.submit(self._fast_copy, entry.path, target)
+                    )
+
+            done, _ = wait(futures)
+            for future in done:
+                future.result()
+
+    def _walk_rel(self, root):
+        # directories are yielded before their contents
+        stack = [("", root)]
+        while stack:
+            prefix, path = stack.pop()
+            with os.scandir(path) as it:
+                for entry in it:
+                    rel = prefix + entry.name
+                    if entry.is_dir():
+                        stack.append((rel + os.sep, entry.path))
+                    yield entry, rel
+
+    def _remove_in_background(self, path):
+        tombstone = f"{path}.rm-{os.getpid()}"
+        os.rename(path, tombstone)
+        errors = []
+
+        def remove():
+            try:
+                shutil.rmtree(tombstone)
+            except OSError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=remove)
+        thread.start()
+        return thread, errors
+
+    def _source_fingerprint(self):
+        parts = []
+        commit = self._source_commit()
+        if commit:
+            parts.append(commit)
+
+        try:
+            with open(os.path.join(self.source_dir, "VERSION")) as f:
+                parts.append(f.read().strip())
+        except FileNotFoundError:
+            pass
+        return ":".join(parts) or None
+
+    def _source_commit(self):
+        git_dir = os.path.join(self.source_dir, ".git")
+        try:
+            with open(os.path.join(git_dir, "HEAD")) as f:
+                head = f.read().strip()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+        if not head.startswith("ref: "):
+            return head
+
+        ref = head[5:]
+        try:
+            with open(os.path.join(git_dir, ref)) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            pass
+
+        try:
+            with open(os.path.join(git_dir, "packed-refs")) as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+        except FileNotFoundError:
+            pass
+        return None
+
+    def _is_up_to_date(self):
+        fingerprint = self._source_fingerprint()
+        if fingerprint is None:
+            return False
+
+        for folder in ("ignis", "matugen"):
+            if not os.path.isdir(os.path.join(self.config_dir, folder)):
+                return False
+
+        for path in (
+            os.path.join(self.config_dir, "niri", "config.kdl"),
+            os.path.join(self.config_dir, "hypr", "hyprland.conf"),
+            self.wallpaper_dest,
+            self.user_settings,
+            self.preview_dest,
+        ):
+            if not os.path.exists(path):
+                return False
+
+        try:
+            with open(self.marker) as f:
+                return f.read() == fingerprint
+        except FileNotFoundError:
+            return False
+
+    def _write_marker(self):
+        fingerprint = self._source_fingerprint()
+        if self.dry_run or fingerprint is None:
+            return
+
+        with open(self.marker, "w") as f:
+            f.write(fingerprint)
 
 
 # ======================